@@ -121,18 +121,17 @@ def is_old_seed(seed):
     from . import old_mnemonic, mnemonic
     seed = mnemonic.normalize_text(seed)
     words = seed.split()
-    try:
-        # checks here are deliberately left weak for legacy reasons, see #3149
-        old_mnemonic.mn_decode(words)
-        uses_electrum_words = True
-    except Exception:
-        uses_electrum_words = False
+    # checks here are deliberately left weak for legacy reasons, see #3149
+    # Only the word count and wordlist membership matter, and checking them directly avoids
+    # raising an exception for every partially entered seed.
+    uses_electrum_words = (len(words) in (12, 24) and
+        all(word in old_mnemonic.words for word in words))
     try:
         seed = bfh(seed)
         is_hex = (len(seed) == 16 or len(seed) == 32)
     except Exception:
         is_hex = False
-    return is_hex or (uses_electrum_words and (len(words) == 12 or len(words) == 24))
+    return is_hex or uses_electrum_words
 
 
 def seed_type(x):
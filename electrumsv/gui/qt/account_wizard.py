@@ -4,7 +4,7 @@ from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Un
 
 from bitcoinx import (Address, Base58Error, bip32_decompose_chain_string,
     bip32_key_from_string, PrivateKey, P2SH_Address)
-from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtCore import QSize, Qt, QTimer
 from PyQt5.QtGui import QPainter, QPalette, QPen, QPixmap, QTextOption
 from PyQt5.QtWidgets import (
     QCheckBox, QVBoxLayout, QHBoxLayout, QLabel, QWizard, QWizardPage, QGridLayout, QGroupBox,
@@ -56,9 +56,17 @@ DEVICE_SETUP_SUCCESS_TEXT = _("Your {} hardware wallet was both successfully det
     "{} wallets. This matches BTC usage and that of most other BSV wallet software. To match "
     "BCH wallet addresses use m/44'/145'/0'")
 
+MULTISIG_SIGNATURES_TEXT = _("Require %d signatures")
+MULTISIG_COSIGNERS_TEXT = _("From %d cosigners")
+
 
 KeystoreMatchType = Union[str, Set[str]]
 
+# Base58check encoded BIP32 extended keys are 111 characters in length, with a four character
+# prefix like "xpub", "xprv", "tpub" or "tprv" depending on the network and key type.
+EXTENDED_KEY_LENGTH = 111
+EXTENDED_KEY_PREFIX_SUFFIXES = ("pub", "prv")
+
 class AccountPages(enum.IntEnum):
     ADD_ACCOUNT_MENU = 12
     CREATE_NEW_STANDARD_ACCOUNT = 13
@@ -345,6 +353,14 @@ class ImportWalletTextPage(QWizardPage):
         self._next_page_id = -1
         self._checked_match_type: Optional[KeystoreTextType] = None
         self._matches: Dict[KeystoreTextType, KeystoreMatchType] = {}
+        self._last_validated_text: Optional[str] = None
+
+        # Matching the text is expensive (seed checksums, base58check, BIP32 parsing), so it is
+        # deferred until the user has stopped typing rather than done on every keystroke.
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(250)
+        self._validate_timer.timeout.connect(self._do_validate)
 
         self.text_area = QTextEdit()
         self.text_area.textChanged.connect(self._on_text_changed)
@@ -444,8 +460,24 @@ class ImportWalletTextPage(QWizardPage):
         self.completeChanged.emit()
 
     def _on_text_changed(self) -> None:
-        matches: Dict[KeystoreTextType, KeystoreMatchType] = {}
+        # Restarts the timer if it is already running.
+        self._validate_timer.start()
+
+    def _flush_validation(self) -> None:
+        # Ensure any pending match work is applied before the matches are relied upon.
+        if self._validate_timer.isActive():
+            self._validate_timer.stop()
+            self._do_validate()
+
+    def _do_validate(self) -> None:
         text = self.text_area.toPlainText().strip()
+        # Whitespace-only edits and paste/undo cycles that restore the same text have nothing
+        # new to match.
+        if text == self._last_validated_text:
+            return
+        self._last_validated_text = text
+
+        matches: Dict[KeystoreTextType, KeystoreMatchType] = {}
 
         # First try the matches that match the entire text.
         if is_old_seed(text):
@@ -456,14 +488,16 @@ class ImportWalletTextPage(QWizardPage):
         if is_checksum_valid and is_wordlist_valid:
             matches[KeystoreTextType.BIP39_SEED_WORDS] = text
 
-        try:
-            key = bip32_key_from_string(text)
-            if isinstance(key, PrivateKey):
-                matches[KeystoreTextType.EXTENDED_PRIVATE_KEY] = text
-            else:
-                matches[KeystoreTextType.EXTENDED_PUBLIC_KEY] = text
-        except (Base58Error, ValueError):
-            pass
+        # Avoid the base58check and BIP32 parsing cost for text that cannot be an extended key.
+        if len(text) == EXTENDED_KEY_LENGTH and text[1:4] in EXTENDED_KEY_PREFIX_SUFFIXES:
+            try:
+                key = bip32_key_from_string(text)
+                if isinstance(key, PrivateKey):
+                    matches[KeystoreTextType.EXTENDED_PRIVATE_KEY] = text
+                else:
+                    matches[KeystoreTextType.EXTENDED_PUBLIC_KEY] = text
+            except (Base58Error, ValueError):
+                pass
 
         # If no full matches, try and match each "word".
         if not len(matches):
@@ -500,7 +534,10 @@ class ImportWalletTextPage(QWizardPage):
         self._set_matches(matches)
 
     def _on_customize_button_clicked(self, *checked) -> None:
-        assert self.isComplete()
+        self._flush_validation()
+        if not self.isComplete():
+            return
+
         self._next_page_id = AccountPages.IMPORT_ACCOUNT_TEXT_CUSTOM
 
         wizard: AccountWizard = self.wizard()
@@ -513,7 +550,9 @@ class ImportWalletTextPage(QWizardPage):
 
     def validatePage(self) -> bool:
         # Called when 'Next' or 'Finish' is clicked for last-minute validation.
-        assert self.isComplete()
+        self._flush_validation()
+        if not self.isComplete():
+            return False
 
         wizard: AccountWizard = self.wizard()
         if self._next_page_id == -1:
@@ -542,6 +581,8 @@ class ImportWalletTextPage(QWizardPage):
         self._set_matches(self._matches)
 
     def on_leave(self) -> None:
+        self._flush_validation()
+
         button = self.wizard().button(QWizard.CustomButton1)
         button.clicked.disconnect()
         button.setVisible(False)
@@ -1274,10 +1315,10 @@ class CreateMultisigAccountPage(QWizardPage):
         grid.addWidget(m_label, 1, 0, Qt.AlignRight)
         grid.addWidget(m_edit, 1, 1, Qt.AlignLeft)
         def on_m(m: int) -> None:
-            m_label.setText(_('Require %d signatures')%m)
+            m_label.setText(MULTISIG_SIGNATURES_TEXT % m)
             cw.set_m(m)
         def on_n(n: int) -> None:
-            n_label.setText(_('From %d cosigners')%n)
+            n_label.setText(MULTISIG_COSIGNERS_TEXT % n)
             cw.set_n(n)
             m_edit.setMaximum(n)
         n_edit.valueChanged.connect(on_n)
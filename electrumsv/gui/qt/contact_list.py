@@ -27,10 +27,10 @@
 from typing import Any, Optional
 
 from PyQt5.QtCore import Qt, QSortFilterProxyModel, QObject, QSize
-from PyQt5.QtGui import QPainter, QPixmap
+from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import (QVBoxLayout, QLabel,
     QLineEdit, QComboBox, QCompleter, QGridLayout, QWidget, QHBoxLayout, QSizePolicy,
-    QStyle, QStyleOption, QPushButton, QToolBar, QAction, QListWidget, QListWidgetItem)
+    QPushButton, QToolBar, QAction, QListWidget, QListWidgetItem)
 
 from electrumsv.contacts import (get_system_id, IDENTITY_SYSTEM_NAMES, IdentitySystem,
     ContactDataError, IdentityCheckResult, ContactEntry, ContactIdentity)
@@ -193,6 +193,8 @@ class ContactCard(QWidget):
     def __init__(self, context: ListContext, contact: ContactEntry, identity: ContactIdentity,
             parent: Any=None):
         super().__init__(parent)
+        # QWidget subclasses do not render style sheet backgrounds without this.
+        self.setAttribute(Qt.WA_StyledBackground, True)
 
         self._context = context
         self._contact = contact
@@ -272,13 +274,6 @@ class ContactCard(QWidget):
 
         self._update()
 
-    # QWidget styles do not render. Found this somewhere on the qt5 doc site.
-    def paintEvent(self, event):
-        opt = QStyleOption()
-        opt.initFrom(self)
-        p = QPainter(self)
-        self.style().drawPrimitive(QStyle.PE_Widget, opt, p, self)
-
     def _update(self):
         self._name_label.setText(self._contact.label)
 
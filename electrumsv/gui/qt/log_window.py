@@ -26,6 +26,7 @@
 from collections import deque
 import logging
 
+from PyQt5.QtGui import QTextCursor
 from PyQt5.QtWidgets import (
     QDialog, QPlainTextEdit, QHBoxLayout, QVBoxLayout, QLabel, QComboBox,
 )
@@ -61,11 +62,9 @@ class SVLogHandler(logging.Handler):
                 deque.popleft()
         app_state.app.new_log.emit(record)
 
-    def emit_all(self):
+    def get_records(self):
         with self:
-            records = self.deque.copy()
-        for record in records:
-            app_state.app.new_log.emit(record)
+            return list(self.deque)
 
 
 class SVLogWindow(QDialog):
@@ -85,7 +84,7 @@ class SVLogWindow(QDialog):
         self.layout()
         app_state.app.new_log.connect(self.new_log)
         app_state.app.new_category.connect(self.new_category)
-        self.log_handler.emit_all()
+        self.show_all_logs()
 
     def reject(self):
         self.hide()
@@ -98,15 +97,23 @@ class SVLogWindow(QDialog):
             msg = self.log_handler.format(record)
             self.log_view.appendPlainText(msg)
 
+    def show_all_logs(self):
+        # Replacing the text in one go costs a single document layout, where appending the
+        # records one at a time relays out and scrolls the view for each of them.
+        format_record = self.log_handler.format
+        lines = [format_record(record) for record in self.log_handler.get_records()
+                 if record.name == self.category or self.category == 'all']
+        self.log_view.setPlainText('\n'.join(lines))
+        self.log_view.moveCursor(QTextCursor.End)
+
     def layout(self):
         self.category_cb = QComboBox()
         self.category_cb.addItem('all')
         for category in sorted(self.log_handler.categories):
             self.category_cb.addItem(category)
         def on_category(_index):
-            self.log_view.setPlainText('')
             self.category = self.category_cb.currentText()
-            self.log_handler.emit_all()
+            self.show_all_logs()
         self.category_cb.currentIndexChanged.connect(on_category)
 
         level_cb = QComboBox()
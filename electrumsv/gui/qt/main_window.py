@@ -80,7 +80,7 @@ from .qrtextedit import ShowQRTextEdit
 from .util import (
     MessageBoxMixin, ColorScheme, HelpLabel, expiration_values, ButtonsLineEdit,
     WindowModalDialog, Buttons, CopyCloseButton, MyTreeWidget, EnterButton,
-    WaitingDialog, ChoicesLayout, OkButton, WWLabel, read_QIcon,
+    WaitingDialog, ChoicesLayout, OkButton, WWLabel, read_QCursor, read_QIcon,
     CloseButton, CancelButton, text_dialog, filename_field,
     update_fixed_tree_height, UntrustedMessageDialog, protected,
     can_show_in_file_explorer, show_in_file_explorer, create_new_wallet
@@ -222,6 +222,10 @@ class ElectrumWindow(QMainWindow, MessageBoxMixin):
         self.load_wallet()
         self.app.timer.timeout.connect(self.timer_actions)
 
+        # Import the account wizard once the event loop is idle, so the first click on the
+        # "add account" action does not stall resolving its module graph.
+        QTimer.singleShot(0, self._preload_account_wizard)
+
     def _create_tabs(self) -> None:
         tabs = self._tab_widget
 
@@ -758,10 +762,11 @@ class ElectrumWindow(QMainWindow, MessageBoxMixin):
 
         self._update_check_toolbar_update()
 
+    def _preload_account_wizard(self) -> None:
+        from . import account_wizard
+
     def add_account(self) -> None:
         from . import account_wizard
-        from importlib import reload
-        reload(account_wizard)
         wizard_window = account_wizard.AccountWizard(self)
         result = wizard_window.run()
         if result != QDialog.Accepted:
@@ -1169,8 +1174,9 @@ class ElectrumWindow(QMainWindow, MessageBoxMixin):
         self._receive_qr = QRCodeWidget(fixedSize=200)
         self._receive_qr.mouseReleaseEvent = lambda x: self._toggle_qr_window()
         self._receive_qr.enterEvent = lambda x: self.app.setOverrideCursor(
-            QCursor(Qt.PointingHandCursor))
-        self._receive_qr.leaveEvent = lambda x: self.app.setOverrideCursor(QCursor(Qt.ArrowCursor))
+            read_QCursor(Qt.PointingHandCursor))
+        self._receive_qr.leaveEvent = lambda x: self.app.setOverrideCursor(
+            read_QCursor(Qt.ArrowCursor))
 
         buttons = QHBoxLayout()
         buttons.addStretch(1)
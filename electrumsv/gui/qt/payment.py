@@ -6,7 +6,7 @@ from PyQt5.QtGui import QPainter, QPixmap, QPalette, QStandardItemModel, QStanda
 from PyQt5.QtWidgets import (QAction, QComboBox, QCompleter, QDialog, QDialogButtonBox,
     QFrame, QGridLayout, QHBoxLayout, QLabel, QLineEdit, QMenu, QPushButton,
     QSizePolicy, QStyledItemDelegate, QTabWidget, QVBoxLayout, QWidget, QLayout,
-    QStyleOptionViewItem, QStyle, QStyleOption, QTableView, QAbstractItemView)
+    QStyleOptionViewItem, QStyle, QTableView, QAbstractItemView)
 
 from electrumsv.contacts import ContactEntry, ContactIdentity, IDENTITY_SYSTEM_NAMES
 from electrumsv.i18n import _
@@ -157,6 +157,8 @@ class PaymentAmountWidget(QWidget):
 class FundsSelectionWidget(QWidget):
     def __init__(self, form_context, parent=None):
         super().__init__(parent)
+        # QWidget subclasses do not render style sheet backgrounds without this.
+        self.setAttribute(Qt.WA_StyledBackground, True)
         self._form_context = form_context
 
         self.setObjectName("FundsSelector")
@@ -255,13 +257,6 @@ class FundsSelectionWidget(QWidget):
         sv_balance.installEventFilter(self)
         fiat_balance.installEventFilter(self)
 
-    # QWidget styles do not render. Found this somewhere on the qt5 doc site.
-    def paintEvent(self, event):
-        opt = QStyleOption()
-        opt.initFrom(self)
-        p = QPainter(self)
-        self.style().drawPrimitive(QStyle.PE_Widget, opt, p, self)
-
     def eventFilter(self, obj, evt):
         # Clicking a balance field sets the amount currency and the amount.
         if obj is self._sv_balance or obj is self._fiat_balance:
@@ -283,6 +278,7 @@ class PayeeBadge(QWidget):
             identity: ContactIdentity, parent: Optional[Any]=None,
             is_interactive: Optional[bool]=True) -> None:
         super().__init__(parent)
+        self.setAttribute(Qt.WA_StyledBackground, True)
 
         self._form_context = form_context
         self.contact = contact
@@ -338,12 +334,6 @@ class PayeeBadge(QWidget):
     def _on_system_button_clicked(self, checked: Optional[bool]=False) -> None:
         pass
 
-    def paintEvent(self, event):
-        opt = QStyleOption()
-        opt.initFrom(self)
-        p = QPainter(self)
-        self.style().drawPrimitive(QStyle.PE_Widget, opt, p, self)
-
 
 class PayeeSearchModel(QAbstractItemModel):
     def __init__(self, identities, parent=None) -> None:
@@ -432,6 +422,7 @@ class PayeeBadgeDelegate(QStyledItemDelegate):
 class PayeeSearchWidget(QWidget):
     def __init__(self, form_context, parent=None) -> None:
         super().__init__(parent)
+        self.setAttribute(Qt.WA_StyledBackground, True)
 
         self._form_context = form_context
 
@@ -477,12 +468,6 @@ class PayeeSearchWidget(QWidget):
         self._filter_model = filter_model
         self.focus_widget = edit_field
 
-    def paintEvent(self, event) -> None:
-        opt = QStyleOption()
-        opt.initFrom(self)
-        p = QPainter(self)
-        self.style().drawPrimitive(QStyle.PE_Widget, opt, p, self)
-
     def _on_entry_selected(self, model_index: QModelIndex) -> None:
         source_index = get_source_index(model_index)
         contact, identity = source_index.model()._get_identity(source_index.row())
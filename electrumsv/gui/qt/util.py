@@ -88,13 +88,13 @@ class HelpLabel(QLabel):
     def enterEvent(self, event):
         self.font.setUnderline(True)
         self.setFont(self.font)
-        self.app.setOverrideCursor(QCursor(Qt.PointingHandCursor))
+        self.app.setOverrideCursor(read_QCursor(Qt.PointingHandCursor))
         return QLabel.enterEvent(self, event)
 
     def leaveEvent(self, event):
         self.font.setUnderline(False)
         self.setFont(self.font)
-        self.app.setOverrideCursor(QCursor(Qt.ArrowCursor))
+        self.app.setOverrideCursor(read_QCursor(Qt.ArrowCursor))
         return QLabel.leaveEvent(self, event)
 
 
@@ -553,7 +553,7 @@ class ButtonsWidget(QWidget):
                              "pressed {border: 1px} padding: 0px; }")
         button.setVisible(True)
         button.setToolTip(tooltip)
-        button.setCursor(QCursor(Qt.PointingHandCursor))
+        button.setCursor(read_QCursor(Qt.PointingHandCursor))
         button.clicked.connect(on_click)
         self.buttons.append(button)
         return button
@@ -706,6 +706,10 @@ def read_qt_ui(ui_name):
 def read_QIcon(icon_basename):
     return QIcon(icon_path(icon_basename))
 
+@lru_cache()
+def read_QCursor(cursor_shape):
+    return QCursor(cursor_shape)
+
 def get_source_index(model_index: QModelIndex, klass: Any):
     model = model_index.model()
     while model is not None and not isinstance(model, klass):
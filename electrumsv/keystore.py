@@ -330,12 +330,18 @@ class Xpub(DerivablePaths):
     def __init__(self) -> None:
         self.xpub: Optional[str] = None
         self._child_xpubs: Dict[Sequence[int], str] = {}
+        self._fingerprint_cache: Optional[Tuple[str, bytes]] = None
 
     def get_master_public_key(self) -> Optional[str]:
         return self.xpub
 
     def get_fingerprint(self) -> bytes:
-        return bip32_key_from_string(self.xpub).fingerprint()
+        assert self.xpub is not None
+        # Paired with the extended key, as `xpub` may be assigned after construction.
+        if self._fingerprint_cache is None or self._fingerprint_cache[0] != self.xpub:
+            fingerprint = bip32_key_from_string(self.xpub).fingerprint()
+            self._fingerprint_cache = (self.xpub, fingerprint)
+        return self._fingerprint_cache[1]
 
     def derive_pubkey(self, derivation_path: Sequence[int]) -> PublicKey:
         parent_path = derivation_path[:-1]
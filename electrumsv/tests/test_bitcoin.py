@@ -428,6 +428,7 @@ class Test_seeds(SequentialTestCase):
         self.assertFalse(is_old_seed(" ".join(["like"] * 18)))
         self.assertTrue(is_old_seed(" ".join(["like"] * 24)))
         self.assertFalse(is_old_seed("not a seed"))
+        self.assertFalse(is_old_seed(" ".join(["like"] * 11 + ["notaword"])))
 
         self.assertTrue(is_old_seed("0123456789ABCDEF" * 2))
         self.assertTrue(is_old_seed("0123456789ABCDEF" * 4))
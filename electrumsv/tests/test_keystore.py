@@ -1,6 +1,6 @@
 import pytest
 
-from bitcoinx import PublicKey, PrivateKey
+from bitcoinx import bip32_key_from_string, PublicKey, PrivateKey
 
 from electrumsv.exceptions import InvalidPassword, IncompatibleWalletError
 from electrumsv.keystore import (
@@ -279,6 +279,21 @@ class TestXPub:
         pubkey = keystore.derive_pubkey((for_change, n))
         assert pubkey == XPublicKey.from_hex(pubkey_hex).to_public_key()
 
+    def test_get_fingerprint(self):
+        xpub = ('xpub661MyMwAqRbcH1RHYeZc1zgwYLJ1dNozE8npCe81pnNYtN6e5KsF6cmt17Fv8w'
+                'GvJrRiv6Kewm8ggBG6N3XajhoioH3stUmLRi53tk46CiA')
+        keystore = BIP32_KeyStore({'xpub': xpub})
+        fingerprint = keystore.get_fingerprint()
+        assert fingerprint == bip32_key_from_string(xpub).fingerprint()
+        assert keystore.get_fingerprint() == fingerprint
+
+        # Replacing the extended key must not return the cached fingerprint of the old one.
+        other_xpub = ('xpub6BoXuZmXMAUMbiEuHuS3s3L6ienv7u5Npx6GMY3MwQnBj7qM89dojV'
+                      'kXTZtbpEvAzxSKAxnnsVDuwSAAvvXHWVncpX46V3LGj5SaKHtNNnc')
+        keystore.xpub = other_xpub
+        assert keystore.get_fingerprint() == bip32_key_from_string(other_xpub).fingerprint()
+        assert keystore.get_fingerprint() != fingerprint
+
     def test_xpubkey(self):
         xpub = ('xpub661MyMwAqRbcH1RHYeZc1zgwYLJ1dNozE8npCe81pnNYtN6e5KsF6cmt17Fv8w'
                 'GvJrRiv6Kewm8ggBG6N3XajhoioH3stUmLRi53tk46CiA')